@@ -127,12 +127,23 @@ LLM_CACHE_FILE = PROJECT_ROOT / "llm_cache.json"
 # False positives tracking file
 FALSE_POSITIVES_FILE = PROJECT_ROOT / "false_positives.json"
 
-# Processed emails tracking file (prevents double-counting)
-PROCESSED_EMAILS_FILE = PROJECT_ROOT / "processed_emails.json"
+# Processed emails tracking database (prevents double-counting; SQLite, safe
+# to share between concurrent runs)
+PROCESSED_EMAILS_DB = PROJECT_ROOT / "processed_emails.db"
+
+# Months of processed email IDs cached in memory (covers the default search
+# window); older IDs are looked up in the database
+PROCESSED_EMAILS_HOT_MONTHS = 3
+
+# Processed emails file of older versions (JSON), migrated into the database on first load
+LEGACY_PROCESSED_EMAILS_FILE = PROJECT_ROOT / "processed_emails.json"
 
 # Merged applications tracking file (tracks merged thread IDs)
 MERGED_APPLICATIONS_FILE = PROJECT_ROOT / "merged_applications.json"
 
+# Merge history log (one JSON object per line, append-only)
+MERGE_HISTORY_FILE = PROJECT_ROOT / "merge_history.jsonl"
+
 # Conflict resolutions tracking file (tracks user HITL decisions)
 CONFLICT_RESOLUTIONS_FILE = PROJECT_ROOT / "conflict_resolutions.json"
 
@@ -166,3 +177,7 @@ STATUS_VALUES = [
 
 # Terminal statuses (no further updates)
 TERMINAL_STATUSES = ["Rejected", "Withdrawn", "Offer Received"]
+
+# Lookup forms of the above: status -> progression index, and a set for membership tests
+STATUS_INDEX = {status: i for i, status in enumerate(STATUS_VALUES)}
+TERMINAL_SET = frozenset(TERMINAL_STATUSES)
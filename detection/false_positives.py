@@ -15,6 +15,13 @@ class FalsePositivesTracker:
         self.file_path = FALSE_POSITIVES_FILE
         self.false_positives = self._load()
 
+        # Set views of the saved lists for constant-time lookups
+        self._message_ids = set(self.false_positives.get("message_ids", []))
+        self._positions = {
+            company: set(positions)
+            for company, positions in self.false_positives.get("companies", {}).items()
+        }
+
     def _load(self) -> dict:
         """Load false positives from disk.
 
@@ -57,17 +64,13 @@ class FalsePositivesTracker:
             bool: True if this is a known false positive
         """
         # Check message ID (most reliable)
-        if message_id in self.false_positives.get("message_ids", []):
+        if message_id in self._message_ids:
             return True
 
         # Check company+position combination
-        companies = self.false_positives.get("companies", {})
-        company_lower = company.lower()
-
-        if company_lower in companies:
-            positions = companies[company_lower]
-            if position.lower() in positions:
-                return True
+        positions = self._positions.get(company.lower())
+        if positions is not None and position.lower() in positions:
+            return True
 
         return False
 
@@ -85,7 +88,8 @@ class FalsePositivesTracker:
         if "message_ids" not in self.false_positives:
             self.false_positives["message_ids"] = []
 
-        if message_id not in self.false_positives["message_ids"]:
+        if message_id not in self._message_ids:
+            self._message_ids.add(message_id)
             self.false_positives["message_ids"].append(message_id)
 
         # Add company+position combination
@@ -98,10 +102,9 @@ class FalsePositivesTracker:
         if company_lower not in self.false_positives["companies"]:
             self.false_positives["companies"][company_lower] = []
 
-        if (
-            position_lower
-            not in self.false_positives["companies"][company_lower]
-        ):
+        positions = self._positions.setdefault(company_lower, set())
+        if position_lower not in positions:
+            positions.add(position_lower)
             self.false_positives["companies"][company_lower].append(
                 position_lower
             )
@@ -1,7 +1,7 @@
 """Fetch emails from Gmail."""
 
 from datetime import datetime, timedelta
-from typing import List
+from typing import Iterator, List
 
 from gmail.client import GmailClient
 from config.settings import GMAIL_SEARCH_DAYS, GMAIL_MAX_RESULTS
@@ -65,23 +65,34 @@ class EmailFetcher:
         """
         return self.client.get_message(message_id, format="full")
 
-    def fetch_messages_batch(self, message_ids: List[str]) -> List[dict]:
-        """Fetch multiple messages.
+    def iter_message_pages(
+        self, message_ids: List[str], page_size: int = 100
+    ) -> Iterator[List[dict]]:
+        """Fetch multiple messages, yielding them one page at a time.
+
+        Pages are yielded in the order of ``message_ids`` so callers can
+        process each page and release the raw payloads before the next
+        page is fetched.
 
         Args:
             message_ids: List of message IDs
+            page_size: Number of messages per page
 
-        Returns:
-            list: List of full message data
+        Yields:
+            list: Full message data for one page
         """
-        messages = []
         total = len(message_ids)
+        page = []
 
         for i, msg_id in enumerate(message_ids, 1):
             if i % 10 == 0:
                 print(f"Fetching messages: {i}/{total}")
 
-            message = self.fetch_message_details(msg_id)
-            messages.append(message)
+            page.append(self.fetch_message_details(msg_id))
 
-        return messages
+            if len(page) >= page_size:
+                yield page
+                page = []
+
+        if page:
+            yield page
@@ -4,7 +4,7 @@ import base64
 from datetime import datetime
 from email.utils import parsedate_to_datetime
 from bs4 import BeautifulSoup
-from typing import Optional
+from typing import Iterator, Optional
 
 from models.email import Email
 from utils.text_utils import (
@@ -13,6 +13,12 @@ from utils.text_utils import (
     clean_html_text,
 )
 
+# Headers needed to build an Email; all others are skipped while parsing
+EMAIL_HEADERS = frozenset({"From", "Subject", "Date"})
+
+# HTML elements that never contain readable body text
+NON_CONTENT_TAGS = ["script", "style", "head", "meta"]
+
 
 class EmailParser:
     """Parse Gmail API messages into Email objects."""
@@ -31,7 +37,11 @@ class EmailParser:
         thread_id = message["threadId"]
 
         # Parse headers
-        headers = {h["name"]: h["value"] for h in message["payload"]["headers"]}
+        headers = {
+            h["name"]: h["value"]
+            for h in message["payload"]["headers"]
+            if h["name"] in EMAIL_HEADERS
+        }
 
         sender_field = headers.get("From", "")
         sender = extract_sender_name(sender_field)
@@ -109,7 +119,7 @@ class EmailParser:
             soup = BeautifulSoup(html, "html.parser")
 
             # Remove script and style elements
-            for element in soup(["script", "style", "head", "meta"]):
+            for element in soup(NON_CONTENT_TAGS):
                 element.decompose()
 
             # Get text
@@ -124,23 +134,18 @@ class EmailParser:
             soup = BeautifulSoup(html, "html.parser")
             return soup.get_text()
 
-    def parse_messages(self, messages: list[dict]) -> list[Email]:
-        """Parse multiple messages.
+    def iter_messages(self, messages: list[dict]) -> Iterator[Email]:
+        """Parse multiple messages lazily, skipping ones that fail to parse.
 
         Args:
             messages: List of Gmail API messages
 
-        Returns:
-            list: List of Email objects
+        Yields:
+            Email: Parsed email objects
         """
-        emails = []
-
         for message in messages:
             try:
-                email = self.parse_message(message)
-                emails.append(email)
+                yield self.parse_message(message)
             except Exception as e:
                 print(f"Error parsing message {message.get('id', 'unknown')}: {e}")
                 continue
-
-        return emails
@@ -139,30 +139,20 @@ class ConflictResolver:
         upgrades: list[FieldConflict],
     ) -> ConflictResolution:
         """Show interactive prompt to resolve conflicts."""
-        # Check if ALL conflicts have saved resolutions
-        all_resolved = True
-        resolved_values = {}
-
-        for conflict in conflicts:
-            saved = self.resolution_tracker.find_resolution(
-                conflict.field_name,
-                conflict.spreadsheet_value,
-                conflict.email_value,
-            )
-            if saved:
-                resolved_values[conflict.field_name] = saved["chosen_value"]
-            else:
-                all_resolved = False
-                break
+        # Check if ALL conflicts have saved resolutions (one lookup pass)
+        patterns = [
+            (conflict.field_name, conflict.spreadsheet_value, conflict.email_value)
+            for conflict in conflicts
+        ]
+        saved_resolutions = self.resolution_tracker.find_resolutions_batch(patterns)
+        all_resolved = all(saved_resolutions.get(pattern) for pattern in patterns)
 
         # If all conflicts have saved resolutions, apply them
         if all_resolved:
-            for conflict in conflicts:
-                saved = self.resolution_tracker.find_resolution(
-                    conflict.field_name,
-                    conflict.spreadsheet_value,
-                    conflict.email_value,
-                )
+            resolved_values = {}
+            for conflict, pattern in zip(conflicts, patterns):
+                saved = saved_resolutions[pattern]
+                resolved_values[conflict.field_name] = saved["chosen_value"]
                 self.console.print(
                     f"[dim]Applied saved resolution: {conflict.field_name} → '{saved['chosen_value']}'[/dim]"
                 )
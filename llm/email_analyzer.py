@@ -182,17 +182,20 @@ class LLMEmailAnalyzer:
             print(f"Fallback failed: {e}")
             return False
 
-    def analyze_batch(self, emails: list[Email]) -> list[Email]:
+    def analyze_batch(
+        self, emails: list[Email], context_emails: Optional[list[Email]] = None
+    ) -> list[Email]:
         """Analyze multiple emails.
 
         Args:
             emails: List of emails to analyze
+            context_emails: Emails to draw thread context from (defaults to emails)
 
         Returns:
             list: Job-related emails only
         """
         # Store all emails for thread context building
-        self.all_emails = emails
+        self.all_emails = context_emails if context_emails is not None else emails
 
         job_emails = []
 
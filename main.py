@@ -41,7 +41,7 @@ console = Console()
 @click.option(
     "--reset-tracking",
     is_flag=True,
-    help="Delete tracking files (processed_emails.json, false_positives.json, merged_applications.json, conflict_resolutions.json) and exit. Use when switching spreadsheets or clearing learned resolutions.",
+    help="Delete tracking files (processed_emails.db, false_positives.json, merged_applications.json, merge_history.jsonl, conflict_resolutions.json) and exit. Use when switching spreadsheets or clearing learned resolutions.",
 )
 @click.option(
     "--non-interactive",
@@ -54,9 +54,11 @@ def main(days: int, dry_run: bool, mode: str, reset_tracking: bool, non_interact
     # Handle reset tracking flag first (early exit)
     if reset_tracking:
         from config.settings import (
-            PROCESSED_EMAILS_FILE,
+            PROCESSED_EMAILS_DB,
+            LEGACY_PROCESSED_EMAILS_FILE,
             FALSE_POSITIVES_FILE,
             MERGED_APPLICATIONS_FILE,
+            MERGE_HISTORY_FILE,
             CONFLICT_RESOLUTIONS_FILE,
         )
 
@@ -65,33 +67,28 @@ def main(days: int, dry_run: bool, mode: str, reset_tracking: bool, non_interact
         files_deleted = []
         files_not_found = []
 
-        # Delete processed_emails.json
-        if PROCESSED_EMAILS_FILE.exists():
-            PROCESSED_EMAILS_FILE.unlink()
-            files_deleted.append("processed_emails.json")
-        else:
-            files_not_found.append("processed_emails.json")
-
-        # Delete false_positives.json
-        if FALSE_POSITIVES_FILE.exists():
-            FALSE_POSITIVES_FILE.unlink()
-            files_deleted.append("false_positives.json")
-        else:
-            files_not_found.append("false_positives.json")
-
-        # Delete merged_applications.json
-        if MERGED_APPLICATIONS_FILE.exists():
-            MERGED_APPLICATIONS_FILE.unlink()
-            files_deleted.append("merged_applications.json")
-        else:
-            files_not_found.append("merged_applications.json")
-
-        # Delete conflict_resolutions.json
-        if CONFLICT_RESOLUTIONS_FILE.exists():
-            CONFLICT_RESOLUTIONS_FILE.unlink()
-            files_deleted.append("conflict_resolutions.json")
-        else:
-            files_not_found.append("conflict_resolutions.json")
+        tracking_files = [
+            PROCESSED_EMAILS_DB,
+            LEGACY_PROCESSED_EMAILS_FILE,
+            FALSE_POSITIVES_FILE,
+            MERGED_APPLICATIONS_FILE,
+            MERGE_HISTORY_FILE,
+            CONFLICT_RESOLUTIONS_FILE,
+        ]
+
+        # SQLite side files, left behind only if a run was interrupted
+        for suffix in ("-wal", "-shm"):
+            side_file = PROCESSED_EMAILS_DB.with_name(PROCESSED_EMAILS_DB.name + suffix)
+            if side_file.exists():
+                tracking_files.append(side_file)
+
+        # Unlink directly (no exists() check) and sort by outcome
+        for path in tracking_files:
+            try:
+                path.unlink()
+                files_deleted.append(path.name)
+            except FileNotFoundError:
+                files_not_found.append(path.name)
 
         # Display results
         if files_deleted:
@@ -145,8 +142,30 @@ def main(days: int, dry_run: bool, mode: str, reset_tracking: bool, non_interact
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
-            # Step 1: Authenticate and fetch emails
-            task = progress.add_task("Authenticating with Gmail...", total=None)
+            # Step 1: Load existing applications and execute merge operations
+            # (preview only in dry run). Runs before any emails are fetched, so
+            # merges happen even on runs without new mail.
+            task = progress.add_task("Loading existing applications...", total=None)
+            manager = ApplicationManager()
+            existing_apps = manager.get_all_applications()
+
+            progress.update(task, description="Processing merge requests...")
+            merge_manager = MergeManager()
+            merged_apps, num_merges = merge_manager.execute_merges(existing_apps, dry_run=dry_run)
+
+            if not dry_run:
+                existing_apps = merged_apps
+
+                if num_merges > 0:
+                    console.print(f"[green]✓ Merged {num_merges} application(s)[/green]\n")
+            else:
+                if num_merges > 0:
+                    console.print(f"[yellow]DRY RUN: Would merge {num_merges} application(s)[/yellow]\n")
+
+                existing_apps = []
+
+            # Step 2: Authenticate and fetch emails
+            progress.update(task, description="Authenticating with Gmail...")
             fetcher = EmailFetcher()
             progress.update(task, description="Fetching recent emails...")
 
@@ -156,31 +175,39 @@ def main(days: int, dry_run: bool, mode: str, reset_tracking: bool, non_interact
                 console.print("[yellow]No emails found in the specified time period.[/yellow]")
                 return
 
+            message_ids = [msg["id"] for msg in message_metadata]
+
+            # Step 3: Fetch details and parse emails page by page, so the raw
+            # payloads of each page are released once it is parsed
             progress.update(
-                task, description=f"Fetching details for {len(message_metadata)} emails..."
+                task, description=f"Fetching and parsing {len(message_ids)} emails..."
             )
-            messages = fetcher.fetch_messages_batch(
-                [msg["id"] for msg in message_metadata]
-            )
-
-            # Step 2: Parse emails
-            progress.update(task, description="Parsing emails...")
             parser = EmailParser()
-            emails = parser.parse_messages(messages)
+            # Sort by date (oldest first) to ensure natural status progression
+            emails = sorted(
+                (
+                    email
+                    for page in fetcher.iter_message_pages(message_ids)
+                    for email in parser.iter_messages(page)
+                ),
+                key=lambda e: e.date,
+            )
 
-            # Sort emails by date (oldest first) to ensure natural status progression
-            emails.sort(key=lambda e: e.date)
+            # Only analyze emails not applied to the sheet in earlier runs
+            unprocessed_ids = set(manager.processed_emails.filter_unprocessed(message_ids))
+            new_emails = [email for email in emails if email.message_id in unprocessed_ids]
 
-            # Step 3: Analyze emails (LLM or rules-based)
+            # Step 4: Analyze emails (LLM or rules-based)
             if mode == "llm":
                 progress.update(task, description="Analyzing emails with LLM...")
                 analyzer = LLMEmailAnalyzer()
-                job_emails = analyzer.analyze_batch(emails)
+                # All fetched emails stay available as thread context
+                job_emails = analyzer.analyze_batch(new_emails, context_emails=emails)
             else:
                 # Rules-based approach
                 progress.update(task, description="Detecting job-related emails...")
                 detector = JobEmailDetector()
-                job_emails = detector.detect_batch(emails)
+                job_emails = detector.detect_batch(new_emails)
 
                 if job_emails:
                     progress.update(task, description="Extracting company and position info...")
@@ -199,32 +226,6 @@ def main(days: int, dry_run: bool, mode: str, reset_tracking: bool, non_interact
 
             console.print(f"[green]Found {len(job_emails)} job-related emails[/green]\n")
 
-            # Step 4: Load existing applications
-            progress.update(task, description="Loading existing applications...")
-            if not dry_run:
-                manager = ApplicationManager()
-                existing_apps = manager.get_all_applications()
-
-                # Step 4.5: Execute merge operations
-                progress.update(task, description="Processing merge requests...")
-                merge_manager = MergeManager()
-                existing_apps, num_merges = merge_manager.execute_merges(existing_apps, dry_run=False)
-
-                if num_merges > 0:
-                    console.print(f"[green]✓ Merged {num_merges} application(s)[/green]\n")
-            else:
-                # Dry run - preview merges without executing
-                manager = ApplicationManager()
-                existing_apps = manager.get_all_applications()
-
-                merge_manager = MergeManager()
-                _, num_merges = merge_manager.execute_merges(existing_apps, dry_run=True)
-
-                if num_merges > 0:
-                    console.print(f"[yellow]DRY RUN: Would merge {num_merges} application(s)[/yellow]\n")
-
-                existing_apps = []
-
             # Step 5: Match and update (process incrementally to ensure proper matching)
             progress.update(task, description="Matching emails to applications...")
             matcher = ApplicationMatcher()
@@ -233,6 +234,7 @@ def main(days: int, dry_run: bool, mode: str, reset_tracking: bool, non_interact
             new_applications = 0
             updated_applications = 0
             skipped_false_positives = 0
+            pending_updates = []
 
             for email in job_emails:
                 # Find match
@@ -270,14 +272,13 @@ def main(days: int, dry_run: bool, mode: str, reset_tracking: bool, non_interact
                         email.company = resolution.company
                         email.position = resolution.position
 
-                    # Update existing application
+                    # Queue update of existing application (written in one batch below)
                     if not dry_run:
-                        updated = manager.update_application(match, email)
-                        if updated:
-                            # Update thread_id if not set
-                            if not match.thread_id:
-                                match.thread_id = email.thread_id
-                            updated_applications += 1
+                        pending_updates.append((match, email))
+                        # Update thread_id if not set
+                        if not match.thread_ids:
+                            match.add_thread_id(email.thread_id)
+                            matcher.register_thread_id(match, email.thread_id)
                     else:
                         updated_applications += 1
                 else:
@@ -294,6 +295,11 @@ def main(days: int, dry_run: bool, mode: str, reset_tracking: bool, non_interact
                     else:
                         new_applications += 1
 
+            # Write all updates to existing applications in one batch
+            if pending_updates:
+                progress.update(task, description="Updating existing applications...")
+                updated_applications, _ = manager.update_applications_batch(pending_updates)
+
         # Display summary
         console.print("\n[bold green]Summary:[/bold green]")
         table = Table(show_header=True, header_style="bold magenta")
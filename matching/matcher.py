@@ -1,15 +1,37 @@
 """Match emails to existing applications."""
 
+import math
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
 from typing import Optional
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from models.email import Email
 from models.application import Application
-from utils.text_utils import normalize_company_name
 from config.settings import MATCHING_THRESHOLD
 from tracking.merged_applications import MergedApplicationsTracker
 
+# Minimum company similarity for any fuzzy match
+FUZZY_COMPANY_CUTOFF = 85
+
+
+def company_length_window(length: int, cutoff: int = FUZZY_COMPANY_CUTOFF) -> tuple[int, int]:
+    """Get the range of string lengths that can reach a fuzz.ratio cutoff.
+
+    fuzz.ratio is 100 * (1 - indel_distance / (len_a + len_b)) and the indel
+    distance is at least the length difference, so a pair can only score
+    >= cutoff if 2 * min_len / (len_a + len_b) >= cutoff / 100.
+
+    Args:
+        length: Length of the query string
+        cutoff: Minimum score (0-100)
+
+    Returns:
+        tuple: (min_length, max_length), inclusive and padded by one for rounding
+    """
+    ratio = cutoff / (200 - cutoff)
+    return max(0, math.floor(length * ratio) - 1), math.ceil(length / ratio) + 1
+
 
 class ApplicationMatcher:
     """Match emails to existing applications using multiple strategies."""
@@ -18,6 +40,92 @@ class ApplicationMatcher:
         """Initialize matcher with merge tracking."""
         self.merged_tracker = MergedApplicationsTracker()
 
+        # Application list currently being matched against, and how many of
+        # its applications (in sheet order) have been indexed so far
+        self._indexed_apps: Optional[list[Application]] = None
+        self._apps: list[Application] = []
+
+        # Distinct normalized companies sorted by length, with their lengths
+        # in a parallel list, so fuzzy matching can bisect to the lengths
+        # that are able to reach the company cutoff
+        self._company_lengths: list[int] = []
+        self._companies_by_length: list[str] = []
+
+        # Lookup indexes built from the same entries
+        self._exact_index: dict[tuple[str, str], Application] = {}
+        self._company_index: dict[str, list[int]] = {}  # Company -> app indexes
+        self._thread_index: dict[str, Application] = {}
+
+        # Company -> app indexes of applications made within the last 30
+        # days, relative to a cutoff fixed when the index is (re)built
+        self._recent_threshold = datetime.now() - timedelta(days=30)
+        self._recent_index: dict[str, list[int]] = {}
+
+    def prepare(self, applications: list[Application]):
+        """Build the lookup indexes for a batch of applications.
+
+        Called automatically by find_match(). When the same list has grown
+        (e.g. newly created applications appended), only the new applications
+        are indexed; any other list triggers a full rebuild.
+
+        Args:
+            applications: List of existing applications
+        """
+        if applications is not self._indexed_apps or len(applications) < len(
+            self._apps
+        ):
+            self._indexed_apps = applications
+            self._apps = []
+            self._company_lengths = []
+            self._companies_by_length = []
+            self._exact_index = {}
+            self._company_index = {}
+            self._thread_index = {}
+            self._recent_threshold = datetime.now() - timedelta(days=30)
+            self._recent_index = {}
+
+        for app in applications[len(self._apps):]:
+            self._add_to_index(app)
+
+    def _add_to_index(self, app: Application):
+        """Add an application to the lookup indexes.
+
+        Args:
+            app: Application to index
+        """
+        app_company = app.company_key
+        self._apps.append(app)
+        index = len(self._apps) - 1
+
+        # Each distinct company is scored once, however many apps share it
+        if app_company not in self._company_index:
+            pos = bisect_right(self._company_lengths, len(app_company))
+            self._company_lengths.insert(pos, len(app_company))
+            self._companies_by_length.insert(pos, app_company)
+
+        self._company_index.setdefault(app_company, []).append(index)
+
+        if app.application_date >= self._recent_threshold:
+            self._recent_index.setdefault(app_company, []).append(index)
+
+        # Apps with unknown position never take part in exact matching;
+        # keep the first app for a key, like the original linear scan did
+        if app.position and app.position != "Unknown Position":
+            self._exact_index.setdefault(app.company_position_key, app)
+
+        for thread_id in app.get_thread_ids():
+            self._thread_index.setdefault(thread_id, app)
+
+    def register_thread_id(self, app: Application, thread_id: str):
+        """Make an application matchable by a thread ID assigned after indexing.
+
+        Args:
+            app: Indexed application that now owns the thread
+            thread_id: Gmail thread ID
+        """
+        if thread_id:
+            self._thread_index.setdefault(thread_id, app)
+
     def find_match(
         self, email: Email, applications: list[Application]
     ) -> tuple[Optional[Application], int]:
@@ -33,37 +141,36 @@ class ApplicationMatcher:
         if not applications:
             return None, 0
 
+        self.prepare(applications)
+
         # Strategy 1: Thread ID match (exact match, 100% confidence)
-        match, confidence = self._match_by_thread_id(email, applications)
+        match, confidence = self._match_by_thread_id(email)
         if match:
             return match, confidence
 
         # Strategy 2: Exact company + position match (95% confidence)
-        match, confidence = self._match_exact(email, applications)
+        match, confidence = self._match_exact(email)
         if match:
             return match, confidence
 
         # Strategy 3: Fuzzy matching (80-90% confidence)
-        match, confidence = self._match_fuzzy(email, applications)
+        match, confidence = self._match_fuzzy(email)
         if match:
             return match, confidence
 
         # Strategy 4: Recent company-only match (70% confidence)
-        match, confidence = self._match_recent_company(email, applications)
+        match, confidence = self._match_recent_company(email)
         if match:
             return match, confidence
 
         # No match found
         return None, 0
 
-    def _match_by_thread_id(
-        self, email: Email, applications: list[Application]
-    ) -> tuple[Optional[Application], int]:
+    def _match_by_thread_id(self, email: Email) -> tuple[Optional[Application], int]:
         """Match by Gmail thread ID (supports merged thread IDs).
 
         Args:
             email: Email to match
-            applications: List of applications
 
         Returns:
             tuple: (matched_application, confidence)
@@ -75,27 +182,23 @@ class ApplicationMatcher:
         if merged_target:
             # Email's thread was merged - search for target thread IDs
             target_thread_ids = [tid.strip() for tid in merged_target.split(",")]
-            for app in applications:
-                app_thread_ids = app.get_thread_ids()
-                if any(tid in app_thread_ids for tid in target_thread_ids):
+            for tid in target_thread_ids:
+                app = self._thread_index.get(tid)
+                if app:
                     return app, 100
 
         # Normal thread ID matching (supports CSV)
-        for app in applications:
-            app_thread_ids = app.get_thread_ids()
-            if email_thread_id in app_thread_ids:
-                return app, 100
+        app = self._thread_index.get(email_thread_id)
+        if app:
+            return app, 100
 
         return None, 0
 
-    def _match_exact(
-        self, email: Email, applications: list[Application]
-    ) -> tuple[Optional[Application], int]:
+    def _match_exact(self, email: Email) -> tuple[Optional[Application], int]:
         """Match by exact company and position.
 
         Args:
             email: Email to match
-            applications: List of applications
 
         Returns:
             tuple: (matched_application, confidence)
@@ -105,30 +208,20 @@ class ApplicationMatcher:
         if not email.company or not email.position or email.position == "Unknown Position":
             return None, 0
 
-        email_company = normalize_company_name(email.company)
-        email_position = email.position.lower().strip()
-
-        for app in applications:
-            # Skip apps with unknown position
-            if not app.position or app.position == "Unknown Position":
-                continue
+        email_company = email.company_key
+        email_position = email.position_key
 
-            app_company = normalize_company_name(app.company)
-            app_position = app.position.lower().strip()
-
-            if email_company == app_company and email_position == app_position:
-                return app, 95
+        app = self._exact_index.get((email_company, email_position))
+        if app:
+            return app, 95
 
         return None, 0
 
-    def _match_fuzzy(
-        self, email: Email, applications: list[Application]
-    ) -> tuple[Optional[Application], int]:
+    def _match_fuzzy(self, email: Email) -> tuple[Optional[Application], int]:
         """Match using fuzzy string matching.
 
         Args:
             email: Email to match
-            applications: List of applications
 
         Returns:
             tuple: (matched_application, confidence)
@@ -139,21 +232,38 @@ class ApplicationMatcher:
         # Check if either side has unknown position
         email_has_unknown = not email.position or email.position == "Unknown Position"
 
-        email_company = normalize_company_name(email.company)
-        email_position = email.position.lower().strip() if email.position else ""
+        email_company = email.company_key
+        email_position = email.position_key
 
         best_match = None
         best_score = 0
 
-        for app in applications:
+        # Only companies of a compatible length can reach the cutoff
+        min_len, max_len = company_length_window(len(email_company))
+        lo = bisect_left(self._company_lengths, min_len)
+        hi = bisect_right(self._company_lengths, max_len)
+
+        # Score the remaining companies in one call; anything below the
+        # cutoff can't match either way
+        candidates = process.extract(
+            email_company,
+            self._companies_by_length[lo:hi],
+            scorer=fuzz.ratio,
+            processor=None,  # Keys are already normalized
+            score_cutoff=FUZZY_COMPANY_CUTOFF,
+            limit=None,
+        )
+        app_indexes = sorted(
+            (index, score)
+            for company, score, _ in candidates
+            for index in self._company_index[company]
+        )
+
+        # Visit candidates in sheet order so ties resolve like a linear scan
+        for index, company_score in app_indexes:
+            app = self._apps[index]
             app_has_unknown = not app.position or app.position == "Unknown Position"
 
-            app_company = normalize_company_name(app.company)
-            app_position = app.position.lower().strip() if app.position else ""
-
-            # Calculate company similarity
-            company_score = fuzz.ratio(email_company, app_company)
-
             # If either has unknown position, use company-only matching
             if email_has_unknown or app_has_unknown:
                 # High company similarity required for position-less match
@@ -162,14 +272,25 @@ class ApplicationMatcher:
                     best_match = app
             else:
                 # Both have positions - use normal fuzzy logic
-                position_score = fuzz.ratio(email_position, app_position)
+                # Only a position score that can beat the current best matters:
+                # combined > best_score <=> position > (best_score - 0.6 * company) / 0.4
+                position_cutoff = max(75, (best_score - company_score * 0.6) / 0.4)
+                if position_cutoff > 100:
+                    continue
+
+                position_score = fuzz.ratio(
+                    email_position,
+                    app.position_key,
+                    processor=None,
+                    score_cutoff=position_cutoff,
+                )
 
                 # Combined score (weighted average)
                 combined_score = (company_score * 0.6) + (position_score * 0.4)
 
                 # Require both to be above threshold
                 if (
-                    company_score >= 85
+                    company_score >= FUZZY_COMPANY_CUTOFF
                     and position_score >= 75
                     and combined_score > best_score
                 ):
@@ -182,9 +303,7 @@ class ApplicationMatcher:
 
         return None, 0
 
-    def _match_recent_company(
-        self, email: Email, applications: list[Application]
-    ) -> tuple[Optional[Application], int]:
+    def _match_recent_company(self, email: Email) -> tuple[Optional[Application], int]:
         """Match by company name only if it's recent (within 30 days).
 
         If both email and application have position data, requires position
@@ -192,7 +311,6 @@ class ApplicationMatcher:
 
         Args:
             email: Email to match
-            applications: List of applications
 
         Returns:
             tuple: (matched_application, confidence)
@@ -200,19 +318,14 @@ class ApplicationMatcher:
         if not email.company:
             return None, 0
 
-        email_company = normalize_company_name(email.company)
-        recent_threshold = datetime.now() - timedelta(days=30)
-
         # Find all recent applications to this company
-        recent_matches = []
-        for app in applications:
-            app_company = normalize_company_name(app.company)
-            if app_company == email_company and app.application_date >= recent_threshold:
-                recent_matches.append(app)
+        recent_matches = self._recent_index.get(
+            email.company_key, []
+        )
 
         # If exactly one recent match found
         if len(recent_matches) == 1:
-            app = recent_matches[0]
+            app = self._apps[recent_matches[0]]
 
             # Check if both have real position data (not "Unknown Position")
             email_has_real_position = (
@@ -229,8 +342,9 @@ class ApplicationMatcher:
             # If both have real position data, require similarity
             if email_has_real_position and app_has_real_position:
                 position_score = fuzz.ratio(
-                    email.position.lower().strip(),
-                    app.position.lower().strip()
+                    email.position_key,
+                    app.position_key,
+                    processor=None,
                 )
                 # Only match if positions are similar (85% threshold)
                 # Higher threshold prevents matching different levels/roles
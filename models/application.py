@@ -1,11 +1,46 @@
 """Application data model."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
+from utils.text_utils import normalize_company_name, normalize_position
 
-@dataclass
+
+def _parse_sheet_date(value: str) -> Optional[datetime]:
+    """Parse a YYYY-MM-DD sheet cell.
+
+    Args:
+        value: Cell value
+
+    Returns:
+        datetime: Parsed date, or None if empty or invalid
+    """
+    if not value:
+        return None
+
+    # Fast path for the exact format written by to_row(); strptime is slow
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return datetime(int(value[:4]), int(value[5:7]), int(value[8:]))
+        except (ValueError, TypeError):
+            pass
+
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except (ValueError, TypeError):
+        return None
+
+
+def _split_thread_ids(value: Optional[str]) -> list[str]:
+    """Split a CSV thread ID cell into a list of thread IDs."""
+    if not value:
+        return []
+    return [tid.strip() for tid in value.split(",") if tid.strip()]
+
+
+@dataclass(slots=True)
 class Application:
     """Represents a job application entry in the spreadsheet."""
 
@@ -21,9 +56,29 @@ class Application:
 
     # For tracking
     row_number: Optional[int] = None  # Sheet row number (not in sheet)
-    thread_id: Optional[str] = None  # Gmail thread ID (in sheet, supports CSV)
+    thread_ids: list[str] = field(default_factory=list)  # Gmail thread IDs (in sheet as CSV)
     merge_into_row: Optional[str] = None  # Target row for manual merge (in sheet)
 
+    @property
+    def company_key(self) -> str:
+        """Normalized company name used for matching."""
+        return normalize_company_name(self.company)
+
+    @property
+    def position_key(self) -> str:
+        """Normalized position title used for matching."""
+        return normalize_position(self.position)
+
+    @property
+    def company_position_key(self) -> tuple[str, str]:
+        """Normalized (company, position) pair used for exact matching."""
+        return (self.company_key, self.position_key)
+
+    @property
+    def thread_id(self) -> Optional[str]:
+        """Thread IDs as stored in the sheet (CSV), or None if there are none."""
+        return ",".join(self.thread_ids) if self.thread_ids else None
+
     def to_row(self) -> list:
         """Convert application to spreadsheet row."""
         return [
@@ -40,7 +95,7 @@ class Application:
             ),
             self.notes,
             self.gmail_link,
-            self.thread_id or "",
+            ",".join(self.thread_ids),
             self.merge_into_row or "",
         ]
 
@@ -61,42 +116,28 @@ class Application:
         merge_into_row_val = row[10] if len(row) > 10 else ""
 
         # Parse dates
-        try:
-            application_date = datetime.strptime(application_date_str, "%Y-%m-%d")
-        except (ValueError, TypeError):
-            application_date = datetime.now()
-
-        try:
-            last_updated = datetime.strptime(last_updated_str, "%Y-%m-%d")
-        except (ValueError, TypeError):
-            last_updated = datetime.now()
-
-        try:
-            latest_email_date = (
-                datetime.strptime(latest_email_date_str, "%Y-%m-%d")
-                if latest_email_date_str
-                else None
-            )
-        except (ValueError, TypeError):
-            latest_email_date = None
+        application_date = _parse_sheet_date(application_date_str) or datetime.now()
+        last_updated = _parse_sheet_date(last_updated_str) or datetime.now()
+        latest_email_date = _parse_sheet_date(latest_email_date_str)
 
         try:
             email_count = int(email_count_str)
         except (ValueError, TypeError):
             email_count = 1
 
+        # Company, position and status repeat across rows; share one object each
         return cls(
-            company=company,
-            position=position,
+            company=sys.intern(company),
+            position=sys.intern(position),
             application_date=application_date,
-            current_status=current_status,
+            current_status=sys.intern(current_status),
             last_updated=last_updated,
             email_count=email_count,
             latest_email_date=latest_email_date,
             notes=notes,
             gmail_link=gmail_link,
             row_number=row_number,
-            thread_id=thread_id_val if thread_id_val else None,
+            thread_ids=_split_thread_ids(thread_id_val),
             merge_into_row=merge_into_row_val if merge_into_row_val else None,
         )
 
@@ -110,9 +151,7 @@ class Application:
         Returns:
             list: List of thread IDs, empty if none
         """
-        if not self.thread_id:
-            return []
-        return [tid.strip() for tid in self.thread_id.split(",") if tid.strip()]
+        return self.thread_ids
 
     def add_thread_id(self, new_thread_id: str):
         """Add a thread ID to this application.
@@ -120,7 +159,35 @@ class Application:
         Args:
             new_thread_id: Thread ID to add
         """
-        current_ids = self.get_thread_ids()
-        if new_thread_id not in current_ids:
-            current_ids.append(new_thread_id)
-            self.thread_id = ",".join(current_ids)
+        if new_thread_id not in self.thread_ids:
+            self.thread_ids.append(new_thread_id)
+
+    def set_thread_ids(self, thread_ids: list[str]):
+        """Replace this application's thread IDs.
+
+        Args:
+            thread_ids: New thread IDs, in the order to store them
+        """
+        self.thread_ids = list(thread_ids)
+
+
+def parse_rows(rows: Iterable[list], first_row_number: int = 2) -> Iterator[Application]:
+    """Parse spreadsheet data rows into applications.
+
+    Empty rows (no company) are skipped and rows that fail to parse are
+    reported and skipped.
+
+    Args:
+        rows: Data rows, without the header row
+        first_row_number: Sheet row number of the first row (1-indexed)
+
+    Yields:
+        Application: Parsed application with its sheet row number
+    """
+    from_row = Application.from_row
+    for i, row in enumerate(rows, start=first_row_number):
+        if row and row[0]:  # Skip empty rows
+            try:
+                yield from_row(row, row_number=i)
+            except Exception as e:
+                print(f"Error parsing row {i}: {e}")
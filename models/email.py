@@ -4,8 +4,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from utils.text_utils import normalize_company_name, normalize_position
 
-@dataclass
+
+@dataclass(slots=True)
 class Email:
     """Represents a parsed email from Gmail."""
 
@@ -26,6 +28,16 @@ class Email:
     status: Optional[str] = None
     email_type: Optional[str] = None
 
+    @property
+    def company_key(self) -> str:
+        """Normalized company name used for matching."""
+        return normalize_company_name(self.company)
+
+    @property
+    def position_key(self) -> str:
+        """Normalized position title used for matching."""
+        return normalize_position(self.position)
+
     def __str__(self) -> str:
         """String representation of email."""
         return f"Email from {self.sender} ({self.date.strftime('%Y-%m-%d')}): {self.subject}"
@@ -8,6 +8,9 @@ from functools import wraps
 from auth.sheets_auth import get_sheets_client
 from config.settings import SPREADSHEET_ID, SHEET_COLUMNS
 
+# Columns holding application data (A = Company ... K = Merge Into Row)
+SHEET_RANGE = "A:K"
+
 
 def retry_on_rate_limit(max_retries=5, base_delay=1.0):
     """Decorator to retry operations with exponential backoff on rate limit errors.
@@ -76,25 +79,40 @@ class SheetsClient:
     def get_all_rows(self) -> list[list]:
         """Get all rows from worksheet.
 
+        Rows are not padded: trailing empty cells are omitted, so a row can
+        be shorter than SHEET_COLUMNS (or empty).
+
         Returns:
             list: List of rows (each row is a list of cell values)
         """
         if not self.worksheet:
             self.open_spreadsheet()
 
-        return self.worksheet.get_all_values()
+        # Only the data columns; skips trailing blank rows/columns instead of
+        # padding every row out to the full grid size like get_all_values().
+        # Values stay formatted so dates keep the YYYY-MM-DD form from_row() parses.
+        return self.worksheet.get(SHEET_RANGE, major_dimension="ROWS")
 
     @retry_on_rate_limit(max_retries=5, base_delay=1.0)
-    def append_row(self, row: list):
+    def append_row(self, row: list) -> Optional[int]:
         """Append a new row to worksheet.
 
         Args:
             row: List of cell values to append
+
+        Returns:
+            int: Row number (1-indexed) the row was written to, or None if unknown
         """
         if not self.worksheet:
             self.open_spreadsheet()
 
-        self.worksheet.append_row(row, value_input_option='USER_ENTERED')
+        response = self.worksheet.append_row(row, value_input_option='USER_ENTERED')
+
+        # updatedRange looks like "Sheet1!A12:K12"
+        updated_range = (response or {}).get("updates", {}).get("updatedRange", "")
+        first_cell = updated_range.rsplit("!", 1)[-1].split(":")[0]
+        row_number = first_cell.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+        return int(row_number) if row_number.isdigit() else None
 
     @retry_on_rate_limit(max_retries=5, base_delay=1.0)
     def append_rows(self, rows: list[list]):
@@ -127,6 +145,27 @@ class SheetsClient:
         cell_range = f"A{row_number}:K{row_number}"
         self.worksheet.update(cell_range, [row], value_input_option='USER_ENTERED')
 
+    @retry_on_rate_limit(max_retries=5, base_delay=1.0)
+    def update_rows(self, updates: list[tuple[int, list]]):
+        """Update multiple existing rows in a single batch request.
+
+        Args:
+            updates: List of (row_number, row) tuples (row numbers 1-indexed)
+        """
+        if not self.worksheet:
+            self.open_spreadsheet()
+
+        if not updates:
+            return
+
+        self.worksheet.batch_update(
+            [
+                {"range": f"A{row_number}:K{row_number}", "values": [row]}
+                for row_number, row in updates
+            ],
+            value_input_option='USER_ENTERED',
+        )
+
     def update_cell(self, row: int, col: int, value: str):
         """Update a single cell.
 
@@ -152,6 +191,37 @@ class SheetsClient:
 
         self.worksheet.delete_rows(row_number)
 
+    @retry_on_rate_limit(max_retries=5, base_delay=1.0)
+    def delete_rows(self, row_numbers: list[int]):
+        """Delete multiple rows from the worksheet in a single batch request.
+
+        Args:
+            row_numbers: Row numbers to delete (1-indexed, as numbered before
+                any of them are deleted)
+        """
+        if not self.worksheet:
+            self.open_spreadsheet()
+
+        if not row_numbers:
+            return
+
+        # Requests run in order, so delete from the bottom up to keep the
+        # remaining row numbers valid
+        requests = [
+            {
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": self.worksheet.id,
+                        "dimension": "ROWS",
+                        "startIndex": row_number - 1,
+                        "endIndex": row_number,
+                    }
+                }
+            }
+            for row_number in sorted(set(row_numbers), reverse=True)
+        ]
+        self.spreadsheet.batch_update({"requests": requests})
+
     def find_row(self, search_col: int, search_value: str) -> Optional[int]:
         """Find row number by searching a column.
 
@@ -170,15 +240,3 @@ class SheetsClient:
             return cell.row if cell else None
         except gspread.exceptions.CellNotFound:
             return None
-
-    @retry_on_rate_limit(max_retries=5, base_delay=1.0)
-    def batch_update(self, updates: list[dict]):
-        """Perform batch updates.
-
-        Args:
-            updates: List of update dicts with 'range' and 'values' keys
-        """
-        if not self.worksheet:
-            self.open_spreadsheet()
-
-        self.worksheet.batch_update(updates, value_input_option='USER_ENTERED')
@@ -4,9 +4,9 @@ from datetime import datetime
 from typing import Optional
 
 from sheets.client import SheetsClient
-from models.application import Application
+from models.application import Application, parse_rows
 from models.email import Email
-from config.settings import TERMINAL_STATUSES, STATUS_VALUES
+from config.settings import TERMINAL_SET, STATUS_INDEX
 from detection.false_positives import FalsePositivesTracker
 from tracking.processed_emails import ProcessedEmailsTracker
 
@@ -25,6 +25,56 @@ class ApplicationManager:
         self.false_positives = FalsePositivesTracker()
         self.processed_emails = ProcessedEmailsTracker()
 
+        # In-memory copy of the sheet used to re-find applications before
+        # updating them; loaded on first use and kept in sync with our own
+        # writes so each update doesn't re-read the whole sheet
+        self._snapshot: Optional[list[Application]] = None
+        self._by_thread: dict[str, list[Application]] = {}  # Thread ID CSV -> apps
+        self._by_cp: dict[tuple[str, str], list[Application]] = {}  # (company, position) -> apps
+
+    def refresh(self):
+        """Drop the sheet snapshot so the next lookup re-reads the sheet.
+
+        Call this after rows were added, deleted or moved by anything other
+        than this manager (e.g. MergeManager).
+        """
+        self._snapshot = None
+        self._by_thread = {}
+        self._by_cp = {}
+
+    def _load_snapshot(self):
+        """Read the sheet once and index it for _find_application_by_identity()."""
+        self._snapshot = self.get_all_applications()
+        self._by_thread = {}
+        self._by_cp = {}
+        for app in self._snapshot:
+            self._index_snapshot_app(app)
+
+    def _index_snapshot_app(self, app: Application):
+        """Add a snapshot application under its current identity keys.
+
+        Keys are only ever added; lookups re-check them, so entries left
+        behind after a company/position change are skipped.
+
+        Args:
+            app: Application from the snapshot
+        """
+        if app.thread_id:
+            self._add_snapshot_key(self._by_thread, app.thread_id, app)
+        self._add_snapshot_key(
+            self._by_cp, (app.company.lower(), app.position.lower()), app
+        )
+
+    @staticmethod
+    def _add_snapshot_key(index: dict, key, app: Application):
+        """Add app under key, keeping each entry list in sheet order."""
+        apps = index.setdefault(key, [])
+        if any(existing is app for existing in apps):
+            return
+        apps.append(app)
+        if len(apps) > 1:
+            apps.sort(key=lambda a: a.row_number or 0)
+
     def get_all_applications(self) -> list[Application]:
         """Get all applications from sheet.
 
@@ -34,17 +84,7 @@ class ApplicationManager:
         rows = self.client.get_all_rows()
 
         # Skip header row
-        applications = []
-        for i, row in enumerate(rows[1:], start=2):
-            if row and row[0]:  # Skip empty rows
-                try:
-                    app = Application.from_row(row, row_number=i)
-                    applications.append(app)
-                except Exception as e:
-                    print(f"Error parsing row {i}: {e}")
-                    continue
-
-        return applications
+        return list(parse_rows(rows[1:]))
 
     def create_application(self, email: Email) -> Optional[Application]:
         """Create new application from email.
@@ -83,14 +123,24 @@ class ApplicationManager:
             latest_email_date=email.date,
             notes="",
             gmail_link=email.gmail_link,
-            thread_id=email.thread_id,
+            thread_ids=[email.thread_id],
         )
 
         # Add to sheet
-        self.client.append_row(application.to_row())
+        row_number = self.client.append_row(application.to_row())
+
+        # Track the new row the way a re-read of the sheet would see it
+        if self._snapshot is not None:
+            if row_number:
+                sheet_app = Application.from_row(application.to_row(), row_number=row_number)
+                self._snapshot.append(sheet_app)
+                self._index_snapshot_app(sheet_app)
+            else:
+                self.refresh()
 
-        # Mark email as processed
+        # Mark email as processed (written right away: the row already exists)
         self.processed_emails.mark_processed(email.message_id)
+        self.processed_emails.flush()
 
         print(f"Created: {application.company} - {application.position}")
 
@@ -106,91 +156,8 @@ class ApplicationManager:
         Returns:
             bool: True if update was performed, False if skipped
         """
-        # Check if this email was already processed
-        if self.processed_emails.is_processed(email.message_id):
-            print(
-                f"Skipping already processed email: {application.company} - {application.position} "
-                f"(message: {email.message_id[:8]}...)"
-            )
-            return False
-
-        # Re-find the application to get current row number and fresh data
-        # (in case rows were manually deleted/reordered)
-        current_app = self._find_application_by_identity(application)
-
-        if not current_app:
-            # Application was manually deleted - record as false positive
-            print(
-                f"Warning: {application.company} - {application.position} was manually deleted. "
-                f"Recording as false positive (won't be re-created)."
-            )
-            self.false_positives.add_false_positive(
-                email.message_id,
-                application.company,
-                application.position,
-            )
-            # Mark as processed so we don't keep trying
-            self.processed_emails.mark_processed(email.message_id)
-            return False
-
-        # Work with fresh data from spreadsheet (current_app)
-        # IMPORTANT: Update company and position from email (may have been resolved via HITL)
-        if email.company and email.company not in ["Unknown", ""]:
-            current_app.company = email.company
-
-        if email.position and email.position not in ["Unknown Position", "Unknown", ""]:
-            current_app.position = email.position
-
-        # IMPORTANT: Preserve application_date and ensure it's the EARLIEST date
-        if email.date < current_app.application_date:
-            # This email is earlier than our current application date - update to earliest
-            current_app.application_date = email.date
-
-        # Check if status should be updated
-        new_status = email.status
-        current_status = current_app.current_status
-
-        # Determine if status update is allowed
-        should_update_status = (
-            current_status not in TERMINAL_STATUSES
-            and self._should_update_status(current_status, new_status)
-        )
-
-        if should_update_status:
-            # Update status
-            current_app.current_status = new_status
-            print(f"Updating status for {current_app.company}: {current_status} -> {new_status}")
-        else:
-            # Status update not allowed (terminal or downgrade)
-            if current_status in TERMINAL_STATUSES:
-                print(
-                    f"Preserving terminal status for {current_app.company}: {current_status} "
-                    f"(not updating to {new_status})"
-                )
-            else:
-                print(
-                    f"Preserving status for {current_app.company}: {current_status} "
-                    f"(would downgrade to {new_status})"
-                )
-
-        # Always update metadata (regardless of status update)
-        current_app.email_count += 1
-        current_app.latest_email_date = max(email.date, current_app.latest_email_date or email.date)
-        current_app.last_updated = email.date
-        if email.gmail_link:
-            current_app.gmail_link = email.gmail_link
-
-        # Update in sheet using current row number
-        if current_app.row_number:
-            self.client.update_row(current_app.row_number, current_app.to_row())
-            print(
-                f"Updated: {current_app.company} - {current_app.position} -> {current_app.current_status}"
-            )
-
-        # Mark email as processed
-        self.processed_emails.mark_processed(email.message_id)
-
-        return True
+        num_updated, _ = self.update_applications_batch([(application, email)])
+        return num_updated > 0
 
     def _should_update_status(self, current: str, new: str) -> bool:
         """Check if status should be updated.
@@ -203,24 +170,22 @@ class ApplicationManager:
             bool: True if should update
         """
         # Terminal statuses should not be updated
-        if current in TERMINAL_STATUSES:
+        if current in TERMINAL_SET:
             return False
 
         # If new status is not in STATUS_VALUES, don't update
-        if new not in STATUS_VALUES:
+        new_idx = STATUS_INDEX.get(new)
+        if new_idx is None:
             return False
 
-        # Get status indices
-        try:
-            current_idx = STATUS_VALUES.index(current)
-            new_idx = STATUS_VALUES.index(new)
-
-            # Only update if new status is forward progress or same
-            return new_idx >= current_idx
-        except ValueError:
-            # If status not found in list, allow update
+        # If current status not found in list, allow update
+        current_idx = STATUS_INDEX.get(current)
+        if current_idx is None:
             return True
 
+        # Only update if new status is forward progress or same
+        return new_idx >= current_idx
+
     def find_application(
         self, company: str, position: str
     ) -> Optional[Application]:
@@ -233,10 +198,25 @@ class ApplicationManager:
         Returns:
             Application: Found application or None
         """
-        applications = self.get_all_applications()
+        if self._snapshot is None:
+            self._load_snapshot()
+
+        return self._lookup_company_position(company, position)
 
-        for app in applications:
-            if app.company.lower() == company.lower() and app.position.lower() == position.lower():
+    def _lookup_company_position(self, company: str, position: str) -> Optional[Application]:
+        """Find the first snapshot application with a company and position.
+
+        Args:
+            company: Company name (case-insensitive)
+            position: Position title (case-insensitive)
+
+        Returns:
+            Application: First match in sheet order, or None
+        """
+        key = (company.lower(), position.lower())
+        for app in self._by_cp.get(key, ()):
+            # Entries can be stale after a company/position change
+            if (app.company.lower(), app.position.lower()) == key:
                 return app
 
         return None
@@ -247,7 +227,9 @@ class ApplicationManager:
         """Re-find application in current spreadsheet state.
 
         Uses thread_id (if available) or company+position to locate the application.
-        This ensures we get the current row number even if rows were manually changed.
+        The sheet is read once (see refresh()) and the snapshot is kept up to
+        date with this manager's own writes, so we get the current row number
+        even if rows were manually changed before the run.
 
         Args:
             application: Application to find
@@ -255,22 +237,20 @@ class ApplicationManager:
         Returns:
             Application: Found application with current row number, or None if deleted
         """
-        # Re-read spreadsheet to get current state
-        current_apps = self.get_all_applications()
+        if self._snapshot is None:
+            self._load_snapshot()
 
         # Try to match by thread_id first (most reliable)
-        if application.thread_id:
-            for app in current_apps:
-                if app.thread_id == application.thread_id:
+        thread_id = application.thread_id
+        if thread_id:
+            for app in self._by_thread.get(thread_id, ()):
+                if app.thread_id == thread_id:
                     return app
 
         # Fall back to company + position match
-        for app in current_apps:
-            if (
-                app.company.lower() == application.company.lower()
-                and app.position.lower() == application.position.lower()
-            ):
-                return app
+        app = self._lookup_company_position(application.company, application.position)
+        if app:
+            return app
 
         # Application not found (may have been manually deleted)
         return None
@@ -317,7 +297,7 @@ class ApplicationManager:
                 latest_email_date=email.date,
                 notes="",
                 gmail_link=email.gmail_link,
-                thread_id=email.thread_id,
+                thread_ids=[email.thread_id],
             )
 
             rows_to_add.append(application.to_row())
@@ -326,11 +306,13 @@ class ApplicationManager:
         # Batch add to sheet
         if rows_to_add:
             self.client.append_rows(rows_to_add)
+            self.refresh()  # New row numbers aren't known; re-read on next lookup
 
             # Mark emails as processed
             for application, email in created_apps:
                 self.processed_emails.mark_processed(email.message_id)
                 print(f"Created: {application.company} - {application.position}")
+            self.processed_emails.flush()
 
         num_created = len(rows_to_add)
         num_skipped = len(emails) - num_created
@@ -338,19 +320,22 @@ class ApplicationManager:
         return num_created, num_skipped
 
     def update_applications_batch(
-        self, updates: list[tuple[Application, Email]]
+        self, updates: list[tuple[Application, Email]], flush_every: int = 100
     ) -> tuple[int, int]:
-        """Update multiple applications in a single batch operation.
+        """Update multiple applications using batched sheet writes.
 
         Args:
             updates: List of (application, email) tuples to update
+            flush_every: Maximum number of rows written per batch request
 
         Returns:
             tuple: (num_updated, num_skipped) counts
         """
-        # Prepare batch updates
-        batch_updates = []
+        # Prepare batch updates; several emails for the same application
+        # collapse into one write of its latest state
+        batch_updates: dict[int, list] = {}  # Row number -> row values
         updated_apps = []
+        num_updated = 0
 
         for application, email in updates:
             # Check if this email was already processed
@@ -396,10 +381,8 @@ class ApplicationManager:
             current_status = current_app.current_status
 
             # Determine if status update is allowed
-            should_update_status = (
-                current_status not in TERMINAL_STATUSES
-                and self._should_update_status(current_status, new_status)
-            )
+            # (_should_update_status also rejects terminal statuses)
+            should_update_status = self._should_update_status(current_status, new_status)
 
             if should_update_status:
                 # Update status
@@ -407,7 +390,7 @@ class ApplicationManager:
                 print(f"Updating status for {current_app.company}: {current_status} -> {new_status}")
             else:
                 # Status update not allowed (terminal or downgrade)
-                if current_status in TERMINAL_STATUSES:
+                if current_status in TERMINAL_SET:
                     print(
                         f"Preserving terminal status for {current_app.company}: {current_status} "
                         f"(not updating to {new_status})"
@@ -425,24 +408,51 @@ class ApplicationManager:
             if email.gmail_link:
                 current_app.gmail_link = email.gmail_link
 
+            # Company/position may have changed; keep the snapshot findable by them
+            self._index_snapshot_app(current_app)
+
             # Add to batch update list
             if current_app.row_number:
-                cell_range = f"A{current_app.row_number}:J{current_app.row_number}"
-                batch_updates.append({"range": cell_range, "values": [current_app.to_row()]})
+                batch_updates[current_app.row_number] = current_app.to_row()
                 updated_apps.append((current_app, email))
 
-        # Execute batch update
-        if batch_updates:
-            self.client.batch_update(batch_updates)
+            if len(batch_updates) >= flush_every:
+                num_updated += self._flush_updates(batch_updates, updated_apps)
 
-            # Mark emails as processed
-            for current_app, email in updated_apps:
-                self.processed_emails.mark_processed(email.message_id)
-                print(
-                    f"Updated: {current_app.company} - {current_app.position} -> {current_app.current_status}"
-                )
-
-        num_updated = len(batch_updates)
+        # Execute remaining batch update
+        num_updated += self._flush_updates(batch_updates, updated_apps)
         num_skipped = len(updates) - num_updated
 
         return num_updated, num_skipped
+
+    def _flush_updates(
+        self, batch_updates: dict[int, list], updated_apps: list[tuple[Application, Email]]
+    ) -> int:
+        """Write pending row updates in one request and mark their emails processed.
+
+        Both collections are cleared afterwards.
+
+        Args:
+            batch_updates: Pending row updates (row number -> row values)
+            updated_apps: (application, email) pairs the updates belong to
+
+        Returns:
+            int: Number of emails applied
+        """
+        if not batch_updates:
+            return 0
+
+        self.client.update_rows(list(batch_updates.items()))
+
+        # Mark emails as processed
+        for current_app, email in updated_apps:
+            self.processed_emails.mark_processed(email.message_id)
+            print(
+                f"Updated: {current_app.company} - {current_app.position} -> {current_app.current_status}"
+            )
+        self.processed_emails.flush()
+
+        num_applied = len(updated_apps)
+        batch_updates.clear()
+        updated_apps.clear()
+        return num_applied
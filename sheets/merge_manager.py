@@ -1,11 +1,12 @@
 """Manage application merge operations."""
 
+from bisect import bisect_left
 from typing import List, Tuple, Optional
 from datetime import datetime
 
 from sheets.client import SheetsClient
-from models.application import Application
-from config.settings import SPREADSHEET_ID, STATUS_VALUES, TERMINAL_STATUSES
+from models.application import Application, parse_rows
+from config.settings import SPREADSHEET_ID, STATUS_INDEX, TERMINAL_SET
 from tracking.merged_applications import MergedApplicationsTracker
 
 
@@ -42,24 +43,34 @@ class MergeManager:
         """
         merge_pairs = []
 
+        # Most runs have nothing flagged; skip building the indexes then
+        merge_flagged = [app for app in applications if app.merge_into_row]
+        if not merge_flagged:
+            return merge_pairs
+
+        # Row number -> application, and row number -> parsed merge target
+        # for every flagged application, so lookups don't rescan the list
+        by_row: dict[int, Application] = {}
         for app in applications:
-            if not app.merge_into_row:
-                continue
+            by_row.setdefault(app.row_number, app)
 
+        merge_targets: dict[int, int] = {}
+        for app in merge_flagged:
             try:
-                target_row = int(app.merge_into_row.strip())
+                merge_targets[app.row_number] = int(app.merge_into_row.strip())
             except (ValueError, AttributeError):
+                pass
+
+        for app in merge_flagged:
+            target_row = merge_targets.get(app.row_number)
+            if target_row is None:
                 print(
                     f"Warning: Invalid merge target '{app.merge_into_row}' for row {app.row_number} - skipping"
                 )
                 continue
 
             # Find target application
-            target_app = None
-            for candidate in applications:
-                if candidate.row_number == target_row:
-                    target_app = candidate
-                    break
+            target_app = by_row.get(target_row)
 
             if not target_app:
                 print(
@@ -69,7 +80,7 @@ class MergeManager:
 
             # Validate merge
             try:
-                self._validate_merge(app, target_app, applications)
+                self._validate_merge(app, target_app, merge_targets)
                 merge_pairs.append((app, target_app))
             except MergeValidationError as e:
                 print(f"Warning: {e} - skipping merge")
@@ -78,14 +89,15 @@ class MergeManager:
         return merge_pairs
 
     def _validate_merge(
-        self, source: Application, target: Application, all_apps: List[Application]
+        self, source: Application, target: Application, merge_targets: dict[int, int]
     ):
         """Validate merge operation.
 
         Args:
             source: Source application
             target: Target application
-            all_apps: All applications (for circular detection)
+            merge_targets: Row number -> merge target row of flagged applications
+                (for circular detection)
 
         Raises:
             MergeValidationError: If validation fails
@@ -97,15 +109,10 @@ class MergeManager:
             )
 
         # Check circular merge (target also wants to merge into source)
-        if target.merge_into_row:
-            try:
-                target_merge_row = int(target.merge_into_row.strip())
-                if target_merge_row == source.row_number:
-                    raise MergeValidationError(
-                        f"Circular merge detected: row {source.row_number} ↔ row {target.row_number}"
-                    )
-            except ValueError:
-                pass
+        if merge_targets.get(target.row_number) == source.row_number:
+            raise MergeValidationError(
+                f"Circular merge detected: row {source.row_number} ↔ row {target.row_number}"
+            )
 
         # Check chain merge (target wants to merge elsewhere)
         if target.merge_into_row and target.merge_into_row.strip():
@@ -115,13 +122,14 @@ class MergeManager:
             )
 
     def execute_merge(
-        self, source: Application, target: Application
+        self, source: Application, target: Application, now: Optional[datetime] = None
     ) -> Application:
         """Execute merge of source into target.
 
         Args:
             source: Source application (will be deleted)
             target: Target application (will be updated)
+            now: Merge time used as last_updated (default: current time)
 
         Returns:
             Application: Updated target application
@@ -188,17 +196,23 @@ class MergeManager:
         source_thread_ids = source.get_thread_ids()
         target_thread_ids = target.get_thread_ids()
 
-        for thread_id in source_thread_ids:
-            if thread_id not in target_thread_ids:
-                target.add_thread_id(thread_id)
+        # Append source IDs the target doesn't have yet, keeping both orders
+        seen = set(target_thread_ids)
+        new_thread_ids = []
+        for tid in source_thread_ids:
+            if tid not in seen:
+                seen.add(tid)
+                new_thread_ids.append(tid)
+        if new_thread_ids:
+            target.set_thread_ids(target_thread_ids + new_thread_ids)
 
         if source_thread_ids:
             print(
-                f"  - Combined thread IDs: {len(source_thread_ids)} from source"
+                f"  - Combined thread IDs: {len(new_thread_ids)} added from source"
             )
 
         # 8. Update last_updated
-        target.last_updated = datetime.now()
+        target.last_updated = now or datetime.now()
 
         # 9. Clear merge flag from target (in case it had one)
         target.merge_into_row = None
@@ -216,39 +230,37 @@ class MergeManager:
             str: Most progressed status
         """
         # If either is terminal, prefer terminal
-        if (
-            status1 in TERMINAL_STATUSES
-            and status2 not in TERMINAL_STATUSES
-        ):
+        status1_terminal = status1 in TERMINAL_SET
+        status2_terminal = status2 in TERMINAL_SET
+        if status1_terminal and not status2_terminal:
             return status1
-        if (
-            status2 in TERMINAL_STATUSES
-            and status1 not in TERMINAL_STATUSES
-        ):
+        if status2_terminal and not status1_terminal:
             return status2
 
         # If both terminal or neither terminal, use STATUS_VALUES order
-        try:
-            idx1 = STATUS_VALUES.index(status1)
-            idx2 = STATUS_VALUES.index(status2)
+        idx1 = STATUS_INDEX.get(status1)
+        idx2 = STATUS_INDEX.get(status2)
+        if idx1 is not None and idx2 is not None:
             return status1 if idx1 >= idx2 else status2
-        except ValueError:
-            # If status not in list, prefer the one that is
-            if status1 in STATUS_VALUES:
-                return status1
-            if status2 in STATUS_VALUES:
-                return status2
-            # Neither in list, keep first
+
+        # If status not in list, prefer the one that is
+        if idx1 is not None:
             return status1
+        if idx2 is not None:
+            return status2
+        # Neither in list, keep first
+        return status1
 
     def execute_merges(
-        self, applications: List[Application], dry_run: bool = False
+        self, applications: List[Application], dry_run: bool = False, reload: bool = False
     ) -> Tuple[List[Application], int]:
         """Find and execute all merge operations.
 
         Args:
             applications: List of all applications
             dry_run: If True, preview merges without executing
+            reload: If True, re-read the sheet after merging instead of
+                deriving the updated list in memory
 
         Returns:
             tuple: (updated_applications_list, num_merges_executed)
@@ -271,16 +283,19 @@ class MergeManager:
         # Execute merges
         merged_count = 0
         rows_to_delete = []
-        batch_updates = []
+        batch_updates: dict[int, list] = {}  # Target row -> latest row values
 
         # Sort by source row descending to avoid row number shifts during deletion
         merge_pairs_sorted = sorted(
             merge_pairs, key=lambda pair: pair[0].row_number, reverse=True
         )
 
+        # One timestamp for the whole batch
+        now = datetime.now()
+
         for source, target in merge_pairs_sorted:
             # Execute merge
-            updated_target = self.execute_merge(source, target)
+            updated_target = self.execute_merge(source, target, now)
 
             # Record merge in tracker
             self.tracker.record_merge(
@@ -290,13 +305,12 @@ class MergeManager:
                 target_row=target.row_number,
                 source_company=source.company,
                 target_company=target.company,
+                timestamp=now,
             )
 
             # Prepare batch update for target row
-            cell_range = f"A{target.row_number}:K{target.row_number}"  # K is column 11
-            batch_updates.append(
-                {"range": cell_range, "values": [updated_target.to_row()]}
-            )
+            # (several sources can merge into one target; only its final state is written)
+            batch_updates[target.row_number] = updated_target.to_row()
 
             # Mark source row for deletion
             rows_to_delete.append(source.row_number)
@@ -306,30 +320,48 @@ class MergeManager:
         # Execute batch update
         if batch_updates:
             print(f"\n[Merge] Updating {len(batch_updates)} target row(s)...")
-            self.client.batch_update(batch_updates)
+            self.client.update_rows(list(batch_updates.items()))
 
-        # Delete source rows (from highest to lowest to avoid row shifts)
+        # Delete source rows in one request (from highest to lowest to avoid row shifts)
         if rows_to_delete:
             print(f"[Merge] Deleting {len(rows_to_delete)} source row(s)...")
-            for row_num in rows_to_delete:
-                self._delete_row(row_num)
+            self.client.delete_rows(rows_to_delete)
+
+        self.tracker.flush()
 
         print(f"\n[Merge] ✓ Completed {merged_count} merge(s)")
 
         # Refresh applications list
-        updated_apps = self._reload_applications()
+        if reload:
+            return self._reload_applications(), merged_count
+
+        return self._remove_deleted_rows(applications, rows_to_delete), merged_count
 
-        return updated_apps, merged_count
+    def _remove_deleted_rows(
+        self, applications: List[Application], deleted_rows: List[int]
+    ) -> List[Application]:
+        """Drop deleted rows from an application list and renumber the rest.
 
-    def _delete_row(self, row_number: int):
-        """Delete a row from the spreadsheet.
+        Mirrors what re-reading the sheet would return: merged targets keep
+        their in-memory state, and every row below a deleted row moves up.
 
         Args:
-            row_number: Row number to delete (1-indexed)
+            applications: Applications as they were before the deletions
+            deleted_rows: Row numbers that were deleted
+
+        Returns:
+            list: Surviving applications in sheet order with current row numbers
         """
-        # Use gspread's delete_rows method
-        if self.client.worksheet:
-            self.client.worksheet.delete_rows(row_number)
+        deleted = sorted(set(deleted_rows))
+        deleted_set = set(deleted)
+
+        surviving = [app for app in applications if app.row_number not in deleted_set]
+        surviving.sort(key=lambda app: app.row_number)
+
+        for app in surviving:
+            app.row_number -= bisect_left(deleted, app.row_number)
+
+        return surviving
 
     def _reload_applications(self) -> List[Application]:
         """Reload all applications from spreadsheet.
@@ -339,14 +371,4 @@ class MergeManager:
         """
         rows = self.client.get_all_rows()
 
-        applications = []
-        for i, row in enumerate(rows[1:], start=2):  # Skip header
-            if row and row[0]:  # Skip empty rows
-                try:
-                    app = Application.from_row(row, row_number=i)
-                    applications.append(app)
-                except Exception as e:
-                    print(f"Error parsing row {i}: {e}")
-                    continue
-
-        return applications
+        return list(parse_rows(rows[1:]))  # Skip header
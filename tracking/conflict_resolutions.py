@@ -1,11 +1,31 @@
 """Track conflict resolution decisions to enable auto-resolution."""
 
+import atexit
 import json
+from functools import lru_cache
 from typing import Optional
 from config.settings import CONFLICT_RESOLUTIONS_FILE
+from utils.json_utils import load_json, write_json_atomic
 from utils.text_utils import normalize_text
 
 
+@lru_cache(maxsize=4096)
+def _make_key(field_name: str, spreadsheet_value: str, email_value: str) -> str:
+    """Generate normalized lookup key.
+
+    Args:
+        field_name: "Company" or "Position"
+        spreadsheet_value: Value from spreadsheet
+        email_value: Value from email
+
+    Returns:
+        str: Normalized key in format "{field}:{norm_ss}:{norm_email}"
+    """
+    norm_ss = normalize_text(spreadsheet_value)
+    norm_email = normalize_text(email_value)
+    return f"{field_name.lower()}:{norm_ss}:{norm_email}"
+
+
 class ConflictResolutionTracker:
     """Track user decisions for conflict resolution."""
 
@@ -14,6 +34,10 @@ class ConflictResolutionTracker:
         self.file_path = CONFLICT_RESOLUTIONS_FILE
         self.data = self._load()
 
+        # Unsaved changes are written by flush() (also at interpreter exit)
+        self._dirty = False
+        atexit.register(self.flush)
+
     def _load(self) -> dict:
         """Load resolutions from disk.
 
@@ -24,41 +48,28 @@ class ConflictResolutionTracker:
             return {"resolutions": {}}
 
         try:
-            with open(self.file_path, "r") as f:
-                data = json.load(f)
-                count = len(data.get("resolutions", {}))
-                if count > 0:
-                    print(f"Loaded {count} conflict resolution(s)")
-                return data
+            data = load_json(self.file_path)
+            count = len(data.get("resolutions", {}))
+            if count > 0:
+                print(f"Loaded {count} conflict resolution(s)")
+            return data
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load conflict resolutions file: {e}")
             return {"resolutions": {}}
 
+    def flush(self):
+        """Write pending changes to disk, if any."""
+        if self._dirty:
+            self._save()
+            self._dirty = False
+
     def _save(self):
         """Save resolutions to disk."""
         try:
-            with open(self.file_path, "w") as f:
-                json.dump(self.data, f, indent=2)
+            write_json_atomic(self.file_path, self.data)
         except IOError as e:
             print(f"Warning: Could not save conflict resolutions file: {e}")
 
-    def _make_key(
-        self, field_name: str, spreadsheet_value: str, email_value: str
-    ) -> str:
-        """Generate normalized lookup key.
-
-        Args:
-            field_name: "Company" or "Position"
-            spreadsheet_value: Value from spreadsheet
-            email_value: Value from email
-
-        Returns:
-            str: Normalized key in format "{field}:{norm_ss}:{norm_email}"
-        """
-        norm_ss = normalize_text(spreadsheet_value)
-        norm_email = normalize_text(email_value)
-        return f"{field_name.lower()}:{norm_ss}:{norm_email}"
-
     def find_resolution(
         self, field_name: str, spreadsheet_value: str, email_value: str
     ) -> Optional[dict]:
@@ -74,9 +85,29 @@ class ConflictResolutionTracker:
                   email_value, chosen_value, resolution_type
             None: If no resolution found
         """
-        key = self._make_key(field_name, spreadsheet_value, email_value)
+        key = _make_key(field_name, spreadsheet_value, email_value)
         return self.data["resolutions"].get(key)
 
+    def find_resolutions_batch(
+        self, conflicts: list[tuple[str, str, str]]
+    ) -> dict[tuple[str, str, str], dict]:
+        """Find existing resolutions for several conflict patterns at once.
+
+        Args:
+            conflicts: (field_name, spreadsheet_value, email_value) tuples
+
+        Returns:
+            dict: Resolution dict per conflict tuple that has one; conflicts
+                  without a saved resolution are left out
+        """
+        resolutions = self.data["resolutions"]
+        keys = [_make_key(*conflict) for conflict in conflicts]
+        return {
+            conflict: resolutions[key]
+            for conflict, key in zip(conflicts, keys)
+            if key in resolutions
+        }
+
     def save_resolution(
         self,
         field_name: str,
@@ -94,7 +125,7 @@ class ConflictResolutionTracker:
             chosen_value: Value user chose to use
             resolution_type: "keep_spreadsheet", "use_email", or "manual"
         """
-        key = self._make_key(field_name, spreadsheet_value, email_value)
+        key = _make_key(field_name, spreadsheet_value, email_value)
 
         self.data["resolutions"][key] = {
             "field_name": field_name,
@@ -104,7 +135,10 @@ class ConflictResolutionTracker:
             "resolution_type": resolution_type,
         }
 
-        self._save()
+        # Written right away: each resolution is an interactive answer that
+        # must not be lost if the run is interrupted
+        self._dirty = True
+        self.flush()
         print(
             f"Saved resolution: {field_name} '{spreadsheet_value}' vs '{email_value}' → '{chosen_value}'"
         )
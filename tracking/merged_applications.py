@@ -1,9 +1,11 @@
 """Track merged applications to enable thread ID lookup."""
 
+import atexit
 import json
 from datetime import datetime
 from typing import Optional
-from config.settings import MERGED_APPLICATIONS_FILE
+from config.settings import MERGED_APPLICATIONS_FILE, MERGE_HISTORY_FILE
+from utils.json_utils import dumps, load_json, write_json_atomic
 
 
 class MergedApplicationsTracker:
@@ -12,36 +14,83 @@ class MergedApplicationsTracker:
     def __init__(self):
         """Initialize tracker."""
         self.file_path = MERGED_APPLICATIONS_FILE
+        self.history_path = MERGE_HISTORY_FILE
         self.data = self._load()
 
+        # Thread ID -> target thread IDs CSV, bound once for lookups
+        self._thread_map: dict[str, str] = self.data["merged_thread_ids"]
+
+        # Mapping saves are deferred until flush() (or interpreter exit)
+        self._dirty = False
+        atexit.register(self.flush)
+
     def _load(self) -> dict:
-        """Load merged applications from disk.
+        """Load merged thread ID mappings from disk.
+
+        Merge history lives in a separate append-only log and is only read
+        when needed (see get_stats()). History found in an older
+        merged_applications.json is kept under "merge_history" until the
+        next recorded merge moves it into the log.
 
         Returns:
             dict: Merged applications data structure
         """
         if not self.file_path.exists():
-            return {"merged_thread_ids": {}, "merge_history": []}
+            return {"merged_thread_ids": {}}
 
         try:
-            with open(self.file_path, "r") as f:
-                data = json.load(f)
-                print(
-                    f"Loaded {len(data.get('merged_thread_ids', {}))} merged thread ID mappings"
-                )
-                return data
+            data = load_json(self.file_path)
+            print(
+                f"Loaded {len(data.get('merged_thread_ids', {}))} merged thread ID mappings"
+            )
+            data.setdefault("merged_thread_ids", {})
+            return data
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load merged applications file: {e}")
-            return {"merged_thread_ids": {}, "merge_history": []}
+            return {"merged_thread_ids": {}}
+
+    def flush(self):
+        """Write pending mapping changes to disk, if any."""
+        if self._dirty:
+            self._save()
+            self._dirty = False
 
     def _save(self):
-        """Save merged applications to disk."""
+        """Save merged thread ID mappings to disk."""
         try:
-            with open(self.file_path, "w") as f:
-                json.dump(self.data, f, indent=2)
+            write_json_atomic(self.file_path, self.data)
         except IOError as e:
             print(f"Warning: Could not save merged applications file: {e}")
 
+    def _append_history(self, entries: list[dict]):
+        """Append merge history entries to the log.
+
+        Args:
+            entries: History entries to append
+        """
+        try:
+            with open(self.history_path, "ab") as f:
+                f.writelines(dumps(entry) + b"\n" for entry in entries)
+        except IOError as e:
+            print(f"Warning: Could not save merge history file: {e}")
+
+    def _count_history(self) -> int:
+        """Count merge history entries without loading them all.
+
+        Returns:
+            int: Number of recorded merges
+        """
+        count = len(self.data.get("merge_history", []))
+
+        if self.history_path.exists():
+            try:
+                with open(self.history_path, "r") as f:
+                    count += sum(1 for line in f if line.strip())
+            except IOError as e:
+                print(f"Warning: Could not read merge history file: {e}")
+
+        return count
+
     def record_merge(
         self,
         source_thread_ids: list[str],
@@ -50,6 +99,7 @@ class MergedApplicationsTracker:
         target_row: int,
         source_company: str,
         target_company: str,
+        timestamp: Optional[datetime] = None,
     ):
         """Record a merge operation.
 
@@ -60,25 +110,38 @@ class MergedApplicationsTracker:
             target_row: Target row number
             source_company: Source company name
             target_company: Target company name
+            timestamp: Merge time (default: current time)
         """
         # Map each source thread ID to target thread IDs
+        merged_thread_ids = self._thread_map
+        changed = False
         for thread_id in source_thread_ids:
-            if thread_id:
-                self.data["merged_thread_ids"][thread_id] = target_thread_ids
+            if thread_id and merged_thread_ids.get(thread_id) != target_thread_ids:
+                merged_thread_ids[thread_id] = target_thread_ids
+                changed = True
+
+        # Move legacy inline history into the log before appending to it
+        if "merge_history" in self.data:
+            self._append_history(self.data.pop("merge_history"))
+            changed = True
+
+        # Only rewrite the mapping file when it changed
+        if changed:
+            self._dirty = True
 
         # Record in history
-        self.data["merge_history"].append(
-            {
-                "timestamp": datetime.now().isoformat(),
-                "source_row": source_row,
-                "target_row": target_row,
-                "source_company": source_company,
-                "target_company": target_company,
-            }
+        self._append_history(
+            [
+                {
+                    "timestamp": (timestamp or datetime.now()).isoformat(),
+                    "source_row": source_row,
+                    "target_row": target_row,
+                    "source_company": source_company,
+                    "target_company": target_company,
+                }
+            ]
         )
 
-        self._save()
-
     def get_merged_thread_ids(self, thread_id: str) -> Optional[str]:
         """Get target thread IDs for a merged thread ID.
 
@@ -88,7 +151,7 @@ class MergedApplicationsTracker:
         Returns:
             str: CSV of target thread IDs, or None if not merged
         """
-        return self.data.get("merged_thread_ids", {}).get(thread_id)
+        return self._thread_map.get(thread_id)
 
     def get_stats(self) -> dict:
         """Get statistics about merges.
@@ -97,6 +160,6 @@ class MergedApplicationsTracker:
             dict: Statistics
         """
         return {
-            "merged_thread_ids": len(self.data.get("merged_thread_ids", {})),
-            "total_merges": len(self.data.get("merge_history", [])),
+            "merged_thread_ids": len(self._thread_map),
+            "total_merges": self._count_history(),
         }
@@ -1,44 +1,146 @@
 """Track processed emails to prevent double-counting."""
 
+import atexit
 import json
-from typing import Set
-from config.settings import PROCESSED_EMAILS_FILE
+import os
+import sqlite3
+from datetime import date
+from typing import Iterable
+from config.settings import (
+    PROCESSED_EMAILS_DB,
+    PROCESSED_EMAILS_HOT_MONTHS,
+    LEGACY_PROCESSED_EMAILS_FILE,
+)
 
 
 class ProcessedEmailsTracker:
-    """Track which emails have already been processed."""
+    """Track which emails have already been processed.
+
+    IDs are stored in a SQLite table keyed by message ID, so marking an email
+    is a single indexed insert and several runs can share the store safely
+    (WAL mode lets readers proceed while another run writes). Marks are
+    buffered and inserted every FLUSH_THRESHOLD IDs, on flush(), when used
+    as a context manager, or at interpreter exit.
+
+    IDs processed in the last PROCESSED_EMAILS_HOT_MONTHS months are cached
+    in memory; older IDs are looked up in the database on a cache miss.
+    """
+
+    FLUSH_THRESHOLD = 64
+
+    QUERY_CHUNK_SIZE = 500  # IDs per "IN (...)" lookup (below SQLite's variable limit)
 
     def __init__(self):
         """Initialize tracker."""
-        self.file_path = PROCESSED_EMAILS_FILE
-        self.processed_ids: Set[str] = self._load()
+        self.db_path = PROCESSED_EMAILS_DB
+        self.legacy_file_path = LEGACY_PROCESSED_EMAILS_FILE
+        self.today = date.today().isoformat()
+        self._pending: list[str] = []  # Marked but not yet inserted
+        try:
+            self.conn = self._connect()
+        except sqlite3.DatabaseError as e:
+            print(f"Warning: Could not open processed emails database: {e}")
+            self._move_aside_corrupt_db()
+            self.conn = self._connect()
+        self.processed_ids: set[str] = self._load()
+        atexit.register(self.flush)
+
+    def __enter__(self) -> "ProcessedEmailsTracker":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
 
-    def _load(self) -> Set[str]:
-        """Load processed message IDs from disk.
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the table if needed."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # Durable enough in WAL mode
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS processed ("
+                "message_id TEXT PRIMARY KEY, processed_on TEXT"
+                ") WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS processed_on_idx ON processed(processed_on)"
+            )
+        return conn
+
+    def _move_aside_corrupt_db(self):
+        """Rename an unreadable database (and its side files) so a fresh one is created."""
+        for suffix in ("", "-wal", "-shm"):
+            path = self.db_path.with_name(self.db_path.name + suffix)
+            if path.exists():
+                os.replace(path, path.with_name(path.name + ".corrupt"))
+        print(f"Moved unreadable {self.db_path.name} aside to {self.db_path.name}.corrupt")
+
+    def _hot_cutoff(self) -> str:
+        """Get the first day of the oldest month cached in memory (ISO date)."""
+        today = date.today()
+        months_back = max(1, PROCESSED_EMAILS_HOT_MONTHS) - 1
+        year, month = divmod(today.year * 12 + today.month - 1 - months_back, 12)
+        return date(year, month + 1, 1).isoformat()
+
+    def _load(self) -> set[str]:
+        """Load processed message IDs of the hot months from the database.
 
         Returns:
-            set: Set of processed message IDs
+            set: Set of recently processed message IDs
         """
-        if not self.file_path.exists():
+        try:
+            self._migrate_legacy()
+            rows = self.conn.execute(
+                "SELECT message_id FROM processed WHERE processed_on >= ?",
+                (self._hot_cutoff(),),
+            )
+            ids = {message_id for (message_id,) in rows}
+        except sqlite3.Error as e:
+            print(f"Warning: Could not load processed emails database: {e}")
             return set()
 
+        print(f"Loaded {len(ids)} processed email IDs")
+        return ids
+
+    def _insert(self, message_ids: Iterable[str], processed_on: str):
+        """Insert message IDs in one transaction, ignoring ones already stored."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO processed (message_id, processed_on) VALUES (?, ?)",
+                ((message_id, processed_on) for message_id in message_ids),
+            )
+
+    def _migrate_legacy(self):
+        """Import the processed_emails.json of older versions into the database.
+
+        Imported IDs are stamped with the migration date, so they are cached
+        in memory like IDs processed today.
+        """
+        if not self.legacy_file_path.exists():
+            return
+
         try:
-            with open(self.file_path, "r") as f:
+            with open(self.legacy_file_path, "r") as f:
                 data = json.load(f)
-                ids = set(data.get("message_ids", []))
-                print(f"Loaded {len(ids)} processed email IDs")
-                return ids
+                message_ids = data.get("message_ids", [])
         except (json.JSONDecodeError, IOError) as e:
             print(f"Warning: Could not load processed emails file: {e}")
-            return set()
+            return
+
+        self._insert(message_ids, self.today)
+        self.legacy_file_path.unlink()
+        print(f"Migrated {len(message_ids)} processed email IDs to {self.db_path.name}")
+
+    def flush(self):
+        """Insert buffered message IDs into the database."""
+        if not self._pending:
+            return
 
-    def _save(self):
-        """Save processed message IDs to disk."""
         try:
-            with open(self.file_path, "w") as f:
-                json.dump({"message_ids": list(self.processed_ids)}, f, indent=2)
-        except IOError as e:
-            print(f"Warning: Could not save processed emails file: {e}")
+            self._insert(self._pending, self.today)
+            self._pending.clear()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not save processed emails database: {e}")
 
     def is_processed(self, message_id: str) -> bool:
         """Check if email has already been processed.
@@ -49,7 +151,42 @@ class ProcessedEmailsTracker:
         Returns:
             bool: True if already processed
         """
-        return message_id in self.processed_ids
+        if message_id in self.processed_ids:
+            return True
+
+        row = self.conn.execute(
+            "SELECT 1 FROM processed WHERE message_id = ?", (message_id,)
+        ).fetchone()
+        if row is None:
+            return False
+        self.processed_ids.add(message_id)
+        return True
+
+    def filter_unprocessed(self, message_ids: Iterable[str]) -> list[str]:
+        """Drop message IDs that have already been processed.
+
+        Args:
+            message_ids: Gmail message IDs
+
+        Returns:
+            list: Unprocessed message IDs, in their original order
+        """
+        processed_ids = self.processed_ids
+        candidates = [message_id for message_id in message_ids if message_id not in processed_ids]
+
+        # Look up cache misses in chunks rather than one query per ID
+        found = set()
+        for start in range(0, len(candidates), self.QUERY_CHUNK_SIZE):
+            chunk = candidates[start : start + self.QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT message_id FROM processed WHERE message_id IN ({placeholders})",
+                chunk,
+            )
+            found.update(message_id for (message_id,) in rows)
+        processed_ids.update(found)
+
+        return [message_id for message_id in candidates if message_id not in found]
 
     def mark_processed(self, message_id: str):
         """Mark email as processed.
@@ -57,9 +194,14 @@ class ProcessedEmailsTracker:
         Args:
             message_id: Gmail message ID
         """
-        if message_id not in self.processed_ids:
-            self.processed_ids.add(message_id)
-            self._save()
+        # set.add is idempotent; a size change means the ID is new (one hash, not two)
+        processed_ids = self.processed_ids
+        before = len(processed_ids)
+        processed_ids.add(message_id)
+        if len(processed_ids) != before:
+            self._pending.append(message_id)
+            if len(self._pending) >= self.FLUSH_THRESHOLD:
+                self.flush()
 
     def get_stats(self) -> dict:
         """Get statistics about processed emails.
@@ -67,4 +209,6 @@ class ProcessedEmailsTracker:
         Returns:
             dict: Statistics
         """
-        return {"total_processed": len(self.processed_ids)}
+        self.flush()
+        (total,) = self.conn.execute("SELECT COUNT(*) FROM processed").fetchone()
+        return {"total_processed": total}
@@ -0,0 +1,84 @@
+"""JSON file helpers."""
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson  # Optional: much faster (de)serialization when installed
+except ImportError:
+    orjson = None
+
+
+def dumps(data, pretty: bool = False) -> bytes:
+    """Serialize data to JSON bytes.
+
+    Args:
+        data: JSON-serializable data
+        pretty: Indent by two spaces for human-readable output
+
+    Returns:
+        bytes: UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, indent=2 if pretty else None).encode("utf-8")
+
+
+def loads(data: bytes | str):
+    """Deserialize JSON.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Deserialized data
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Path):
+    """Read and deserialize a JSON file.
+
+    Args:
+        path: File path
+
+    Returns:
+        Deserialized data
+
+    Raises:
+        IOError: If the file can't be read
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def write_json_atomic(path: Path, data, pretty: bool = True):
+    """Write JSON to a file atomically.
+
+    The data is written to a temporary file next to the target and moved
+    over it, so a crash mid-write never leaves a truncated file behind.
+
+    Args:
+        path: Target file path
+        data: JSON-serializable data
+        pretty: Indent for human-readable output
+
+    Raises:
+        IOError: If the file can't be written
+    """
+    payload = dumps(data, pretty=pretty)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
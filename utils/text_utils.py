@@ -1,29 +1,72 @@
 """Text processing utilities."""
 
 import re
+from functools import lru_cache
 from config.keywords import COMPANY_SUFFIXES
 
-
+# Email address, display name before "<", and common non-company subdomains
+_EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+")
+_NAME_RE = re.compile(r"([^<]+)\s*<")
+_SUBDOMAIN_RE = re.compile(r"^(www|mail|careers|jobs|recruiting|talent)\.")
+
+# Per-suffix patterns: suffix at end of string with optional period and spaces.
+# Suffixes are lowercased here and only ever matched against lowercased names,
+# so no IGNORECASE (and its per-character case folding) is needed.
+_SUFFIX_PATTERNS = [
+    re.compile(rf"\s+{re.escape(suffix.lower())}\.?\s*$") for suffix in COMPANY_SUFFIXES
+]
+
+# Matches if any suffix pattern would; lets names without a suffix skip the loop
+_ANY_SUFFIX_RE = re.compile(
+    r"\s+(?:"
+    + "|".join(re.escape(suffix.lower()) for suffix in COMPANY_SUFFIXES)
+    + r")\.?\s*$"
+)
+
+
+def _is_normalized(text: str) -> bool:
+    """Check if text is already lowercase and single-spaced.
+
+    isprintable() rules out every whitespace character except a plain space,
+    so such text comes back unchanged from lower(), strip() and split/join.
+    """
+    return (
+        text.islower()
+        and text.isprintable()
+        and text[0] != " "
+        and text[-1] != " "
+        and "  " not in text
+    )
+
+
+@lru_cache(maxsize=4096)
 def normalize_text(text: str) -> str:
     """Normalize text for comparison (lowercase, trim whitespace)."""
     if not text:
         return ""
+    if _is_normalized(text):
+        return text
     return " ".join(text.lower().strip().split())
 
 
+@lru_cache(maxsize=4096)
 def normalize_company_name(company: str) -> str:
     """Normalize company name for matching."""
     if not company:
         return ""
 
+    # Already-normalized names without a suffix need no work
+    if _is_normalized(company) and not _ANY_SUFFIX_RE.search(company):
+        return company
+
     # Convert to lowercase and strip
     normalized = company.lower().strip()
 
-    # Remove common suffixes
-    for suffix in COMPANY_SUFFIXES:
-        # Match suffix at end of string with optional period and spaces
-        pattern = rf"\s+{re.escape(suffix)}\.?\s*$"
-        normalized = re.sub(pattern, "", normalized, flags=re.IGNORECASE)
+    # Remove common suffixes, one pass per suffix in list order (so e.g.
+    # "acme co. inc" loses both); most names have none and skip this
+    if _ANY_SUFFIX_RE.search(normalized):
+        for pattern in _SUFFIX_PATTERNS:
+            normalized = pattern.sub("", normalized)
 
     # Remove extra whitespace
     normalized = " ".join(normalized.split())
@@ -31,17 +74,25 @@ def normalize_company_name(company: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=4096)
+def normalize_position(position: str) -> str:
+    """Normalize position title for matching (lowercase, trim)."""
+    if not position:
+        return ""
+    return position.lower().strip()
+
+
 def extract_email_domain(email: str) -> str:
     """Extract domain from email address."""
     if not email or "@" not in email:
         return ""
 
     # Remove angle brackets if present (e.g., "Name <email@domain.com>")
-    email = re.search(r"[\w\.-]+@[\w\.-]+", email)
+    email = _EMAIL_RE.search(email)
     if not email:
         return ""
 
-    domain = email.group(0).split("@")[1].lower()
+    domain = email.group(0).rpartition("@")[2].lower()
     return domain
 
 
@@ -51,7 +102,7 @@ def extract_email_address(sender_field: str) -> str:
         return ""
 
     # Match email pattern
-    match = re.search(r"[\w\.-]+@[\w\.-]+", sender_field)
+    match = _EMAIL_RE.search(sender_field)
     if match:
         return match.group(0).lower()
 
@@ -64,7 +115,7 @@ def extract_sender_name(sender_field: str) -> str:
         return ""
 
     # Try to extract name before email in angle brackets
-    match = re.match(r"([^<]+)\s*<", sender_field)
+    match = _NAME_RE.match(sender_field)
     if match:
         name = match.group(1).strip()
         # Remove quotes if present
@@ -73,7 +124,7 @@ def extract_sender_name(sender_field: str) -> str:
 
     # If no angle brackets, return the part before @
     if "@" in sender_field:
-        return sender_field.split("@")[0]
+        return sender_field.partition("@")[0]
 
     return sender_field
 
@@ -83,12 +134,14 @@ def clean_html_text(text: str) -> str:
     if not text:
         return ""
 
-    # Remove common HTML entities
-    text = re.sub(r"&nbsp;", " ", text)
-    text = re.sub(r"&amp;", "&", text)
-    text = re.sub(r"&lt;", "<", text)
-    text = re.sub(r"&gt;", ">", text)
-    text = re.sub(r"&quot;", '"', text)
+    # Remove common HTML entities (in this order, so "&amp;lt;" still becomes "<")
+    text = (
+        text.replace("&nbsp;", " ")
+        .replace("&amp;", "&")
+        .replace("&lt;", "<")
+        .replace("&gt;", ">")
+        .replace("&quot;", '"')
+    )
 
     # Remove extra whitespace
     text = " ".join(text.split())
@@ -104,22 +157,29 @@ def truncate_text(text: str, max_length: int = 100) -> str:
     return text[: max_length - 3] + "..."
 
 
+@lru_cache(maxsize=128)
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern:
+    """Compile one alternation matching any of the lowercased keywords."""
+    return re.compile("|".join(re.escape(keyword.lower()) for keyword in keywords))
+
+
 def contains_any_keyword(text: str, keywords: list[str]) -> bool:
     """Check if text contains any of the keywords (case-insensitive)."""
-    if not text:
+    if not text or not keywords:
         return False
 
-    text_lower = text.lower()
-    return any(keyword.lower() in text_lower for keyword in keywords)
+    # One regex scan instead of a substring search per keyword
+    return _keyword_pattern(tuple(keywords)).search(text.lower()) is not None
 
 
+@lru_cache(maxsize=4096)
 def extract_domain_company_name(domain: str) -> str:
     """Extract company name from domain (e.g., 'careers.google.com' -> 'google')."""
     if not domain:
         return ""
 
     # Remove common subdomains
-    domain = re.sub(r"^(www|mail|careers|jobs|recruiting|talent)\.", "", domain)
+    domain = _SUBDOMAIN_RE.sub("", domain)
 
     # Get the main part (before TLD)
     parts = domain.split(".")